@@ -16,7 +16,6 @@ Python version: >=3.8
 #   IMPORTS
 # =================================================================================================
 
-import shutil
 from pathlib import Path
 
 import gmsh
@@ -29,13 +28,10 @@ from ceasiompy.CPACS2GMSH.func.advancemeshing import (
 )
 from ceasiompy.CPACS2GMSH.func.exportbrep import export_brep
 from ceasiompy.CPACS2GMSH.func.generategmesh import generate_gmsh
-from ceasiompy.utils.ceasiompyutils import remove_file_type_in_dir
 from ceasiompy.utils.commonpaths import CPACS_FILES_PATH
 from cpacspy.cpacspy import CPACS
 
-MODULE_DIR = Path(__file__).parent
 CPACS_IN_PATH = Path(CPACS_FILES_PATH, "simple_sharp_airfoil.xml")
-TEST_OUT_PATH = Path(MODULE_DIR, "ToolOutput")
 
 # =================================================================================================
 #   CLASSES
@@ -204,24 +200,20 @@ def test_compute_area():
     gmsh.finalize()
 
 
-def test_refine_wing_section():
+def test_refine_wing_section(tmp_path):
     """
     Test if the wing section is correctly refined by the advancemeshing algorithm
     """
 
-    if TEST_OUT_PATH.exists():
-        shutil.rmtree(TEST_OUT_PATH)
-    TEST_OUT_PATH.mkdir()
-
     cpacs = CPACS(CPACS_IN_PATH)
 
-    export_brep(cpacs, TEST_OUT_PATH)
+    export_brep(cpacs, tmp_path)
 
     generate_gmsh(
         cpacs=cpacs,
         cpacs_path=CPACS_IN_PATH,
-        brep_dir=TEST_OUT_PATH,
-        results_dir=TEST_OUT_PATH,
+        brep_dir=tmp_path,
+        results_dir=tmp_path,
         open_gmsh=False,
         farfield_factor=2,
         symmetry=False,
@@ -263,27 +255,21 @@ def test_refine_wing_section():
     gmsh.clear()
     gmsh.finalize()
 
-    remove_file_type_in_dir(TEST_OUT_PATH, [".brep", ".su2", ".cfg"])
-
 
-def test_auto_refine():
+def test_auto_refine(tmp_path):
     """
     Test if the wing section is correctly remeshed when the area is too small
     """
 
-    if TEST_OUT_PATH.exists():
-        shutil.rmtree(TEST_OUT_PATH)
-    TEST_OUT_PATH.mkdir()
-
     cpacs = CPACS(CPACS_IN_PATH)
 
-    export_brep(cpacs, TEST_OUT_PATH)
+    export_brep(cpacs, tmp_path)
 
     generate_gmsh(
         cpacs=cpacs,
         cpacs_path=CPACS_IN_PATH,
-        brep_dir=TEST_OUT_PATH,
-        results_dir=TEST_OUT_PATH,
+        brep_dir=tmp_path,
+        results_dir=tmp_path,
         open_gmsh=False,
         farfield_factor=5,
         symmetry=False,
@@ -306,8 +292,6 @@ def test_auto_refine():
     gmsh.clear()
     gmsh.finalize()
 
-    remove_file_type_in_dir(TEST_OUT_PATH, [".brep", ".su2", ".cfg"])
-
 
 # =================================================================================================
 #    MAIN
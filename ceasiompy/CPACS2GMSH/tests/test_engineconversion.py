@@ -17,7 +17,6 @@ Python version: >=3.8
 # =================================================================================================
 
 
-import os
 import shutil
 from pathlib import Path
 
@@ -26,7 +25,6 @@ from ceasiompy.CPACS2GMSH.func.engineconversion import close_engine
 from ceasiompy.utils.commonnames import GMSH_ENGINE_CONFIG_NAME
 
 MODULE_DIR = Path(__file__).parent
-TEST_OUT_PATH = Path(MODULE_DIR, "ToolOutput")
 TEST_IN_PATH = Path(MODULE_DIR, "ToolInput")
 
 
@@ -40,13 +38,11 @@ TEST_IN_PATH = Path(MODULE_DIR, "ToolInput")
 # =================================================================================================
 
 
-def test_close_engine():
+def test_close_engine(tmp_path):
     """Test the close_engine function with a simple engine"""
 
-    # Create a a new file where the test will be made
-    if not (Path(TEST_IN_PATH, "test_close_engine")).exists():
-        os.mkdir(Path(TEST_IN_PATH, "test_close_engine"))
-    TEST_DIR_PATH = Path(TEST_IN_PATH, "test_close_engine")
+    # The test is made in its own temporary directory
+    TEST_DIR_PATH = tmp_path
 
     # Copy nacelle brep files and cfg file in the test dir
     shutil.copy(Path(TEST_IN_PATH, "SimpleNacelle_fanCowl.brep"), TEST_DIR_PATH)
@@ -93,10 +89,6 @@ def test_close_engine():
     gmsh.clear()
     gmsh.finalize()
 
-    # Delete the closed engine file
-    if TEST_DIR_PATH.exists():
-        shutil.rmtree(TEST_DIR_PATH)
-
 
 # =================================================================================================
 #    MAIN
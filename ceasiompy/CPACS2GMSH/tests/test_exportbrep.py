@@ -16,7 +16,6 @@ Python version: >=3.8
 #   IMPORTS
 # =================================================================================================
 
-import shutil
 from pathlib import Path
 from unittest.mock import patch
 
@@ -25,10 +24,8 @@ from ceasiompy.CPACS2GMSH.func.exportbrep import export_brep
 from ceasiompy.utils.commonpaths import CPACS_FILES_PATH
 from cpacspy.cpacspy import CPACS
 
-MODULE_DIR = Path(__file__).parent
 CPACS_IN_PATH = Path(CPACS_FILES_PATH, "simpletest_cpacs.xml")
 CPACS_IN_SIMPLE_ENGINE_PATH = Path(CPACS_FILES_PATH, "simple_engine.xml")
-TEST_OUT_PATH = Path(MODULE_DIR, "ToolOutput")
 
 
 # =================================================================================================
@@ -41,18 +38,14 @@ TEST_OUT_PATH = Path(MODULE_DIR, "ToolOutput")
 # =================================================================================================
 
 
-def test_export_brep():
+def test_export_brep(tmp_path):
     """Test function for 'export_brep'"""
 
-    if TEST_OUT_PATH.exists():
-        shutil.rmtree(TEST_OUT_PATH)
-    TEST_OUT_PATH.mkdir()
-
     cpacs = CPACS(CPACS_IN_PATH)
 
-    export_brep(cpacs, TEST_OUT_PATH)
+    export_brep(cpacs, tmp_path)
 
-    brep_files = list(TEST_OUT_PATH.glob("*.brep"))
+    brep_files = list(tmp_path.glob("*.brep"))
     brep_file_names = [brep_file.name for brep_file in brep_files]
 
     assert len(brep_files) == 3  # simpletest_cpacs.xml containt only 3 parts
@@ -66,20 +59,16 @@ def test_export_brep():
 
     with pytest.raises(FileNotFoundError):
         with patch("ceasiompy.CPACS2GMSH.func.exportbrep.export_shapes", return_value=True):
-            export_brep(cpacs, TEST_OUT_PATH)
-
+            export_brep(cpacs, tmp_path)
 
-def test_export_brep_with_engine():
 
-    if TEST_OUT_PATH.exists():
-        shutil.rmtree(TEST_OUT_PATH)
-    TEST_OUT_PATH.mkdir()
+def test_export_brep_with_engine(tmp_path):
 
     cpacs = CPACS(CPACS_IN_SIMPLE_ENGINE_PATH)
 
-    export_brep(cpacs, TEST_OUT_PATH)
+    export_brep(cpacs, tmp_path)
 
-    brep_files = list(TEST_OUT_PATH.glob("*.brep"))
+    brep_files = list(tmp_path.glob("*.brep"))
     brep_file_names = [brep_file.name for brep_file in brep_files]
 
     assert len(brep_files) == 7  # simple_engine.xml containt 7 parts
@@ -97,7 +86,7 @@ def test_export_brep_with_engine():
 
     with pytest.raises(FileNotFoundError):
         with patch("ceasiompy.CPACS2GMSH.func.exportbrep.export_shapes", return_value=True):
-            export_brep(cpacs, TEST_OUT_PATH)
+            export_brep(cpacs, tmp_path)
 
 
 # =================================================================================================
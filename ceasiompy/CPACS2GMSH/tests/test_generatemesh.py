@@ -16,27 +16,27 @@ Python version: >=3.8
 #   IMPORTS
 # =================================================================================================
 
-import shutil
 from pathlib import Path
 
-import gmsh
-from ceasiompy.CPACS2GMSH.func.exportbrep import export_brep
-from ceasiompy.CPACS2GMSH.func.generategmesh import (
+import pytest
+
+# Skip the whole module (instead of failing at collection) if gmsh or cpacspy are not available
+gmsh = pytest.importorskip("gmsh")
+CPACS = pytest.importorskip("cpacspy.cpacspy").CPACS
+
+from ceasiompy.CPACS2GMSH.func.exportbrep import export_brep  # noqa: E402
+from ceasiompy.CPACS2GMSH.func.generategmesh import (  # noqa: E402
     ModelPart,
     generate_gmsh,
     get_entities_from_volume,
 )
-from ceasiompy.SU2Run.func.su2utils import get_mesh_markers
-from ceasiompy.utils.ceasiompyutils import remove_file_type_in_dir
-from ceasiompy.utils.commonpaths import CPACS_FILES_PATH
-from cpacspy.cpacspy import CPACS
+from ceasiompy.SU2Run.func.su2utils import get_mesh_markers  # noqa: E402
+from ceasiompy.utils.commonpaths import CPACS_FILES_PATH  # noqa: E402
 
-MODULE_DIR = Path(__file__).parent
 CPACS_IN_PATH = Path(CPACS_FILES_PATH, "simpletest_cpacs.xml")
 CPACS_IN_SIMPLE_ENGINE_PATH = Path(CPACS_FILES_PATH, "simple_engine.xml")
 CPACS_IN_SIMPLE_DOUBLEFLUX_ENGINE_PATH = Path(CPACS_FILES_PATH, "simple_doubleflux_engine.xml")
 CPACS_IN_PROPELLER_ENGINE_PATH = Path(CPACS_FILES_PATH, "simple_propeller.xml")
-TEST_OUT_PATH = Path(MODULE_DIR, "ToolOutput")
 
 # =================================================================================================
 #   CLASSES
@@ -48,25 +48,59 @@ TEST_OUT_PATH = Path(MODULE_DIR, "ToolOutput")
 # =================================================================================================
 
 
-def test_generate_gmsh():
-    """
-    This test try to generate a simple mesh and test if the SU2 markers
-    are correctly assigned for simpletest_cpacs.xml
+@pytest.fixture(scope="module", autouse=True)
+def gmsh_session():
+    """Initialize gmsh only once for all the tests of this module."""
+
+    gmsh.initialize()
+    yield
+    if gmsh.isInitialized():
+        gmsh.finalize()
+
+
+@pytest.fixture(autouse=True)
+def gmsh_model():
+    """Reset the gmsh model after each test.
+
+    'generate_gmsh' (with testing_gmsh=False) finalizes gmsh by itself, in that case gmsh is
+    initialized again for the next test.
     """
 
-    if TEST_OUT_PATH.exists():
-        shutil.rmtree(TEST_OUT_PATH)
-    TEST_OUT_PATH.mkdir()
+    if not gmsh.isInitialized():
+        gmsh.initialize()
+    yield
+    if gmsh.isInitialized():
+        gmsh.clear()
 
-    cpacs = CPACS(CPACS_IN_PATH)
 
-    export_brep(cpacs, TEST_OUT_PATH)
+@pytest.fixture(scope="module")
+def simpletest_cpacs():
+    """CPACS object of 'simpletest_cpacs.xml', only parsed once for the whole module."""
 
-    generate_gmsh(
-        cpacs=cpacs,
+    return CPACS(CPACS_IN_PATH)
+
+
+@pytest.fixture(scope="module")
+def simpletest_brep_dir(simpletest_cpacs, tmp_path_factory):
+    """Directory containing the BREP files of 'simpletest_cpacs.xml', only exported once."""
+
+    brep_dir = tmp_path_factory.mktemp("simpletest_brep")
+    export_brep(simpletest_cpacs, brep_dir)
+
+    return brep_dir
+
+
+def test_generate_gmsh(simpletest_cpacs, simpletest_brep_dir, tmp_path):
+    """
+    This test try to generate a simple mesh and test if the SU2 markers
+    are correctly assigned for simpletest_cpacs.xml
+    """
+
+    su2mesh_path, _ = generate_gmsh(
+        cpacs=simpletest_cpacs,
         cpacs_path=CPACS_IN_PATH,
-        brep_dir=TEST_OUT_PATH,
-        results_dir=TEST_OUT_PATH,
+        brep_dir=simpletest_brep_dir,
+        results_dir=tmp_path,
         open_gmsh=False,
         farfield_factor=2,
         symmetry=False,
@@ -83,33 +117,23 @@ def test_generate_gmsh():
         testing_gmsh=False,
     )
 
-    mesh_markers = get_mesh_markers(Path(TEST_OUT_PATH, "mesh.su2"))
+    mesh_markers = get_mesh_markers(su2mesh_path)
     assert mesh_markers["wall"] == ["SimpleFuselage", "Wing", "Wing_mirrored"]
     assert mesh_markers["farfield"] == ["Farfield"]
 
-    remove_file_type_in_dir(TEST_OUT_PATH, [".brep", ".su2", ".cfg"])
-
 
-def test_generate_gmsh_symm():
+def test_generate_gmsh_symm(simpletest_cpacs, simpletest_brep_dir, tmp_path):
     """
     This test try to generate a simple symmetric mesh and test if the SU2 markers
     are correctly assigned for simpletest_cpacs.xml
 
     """
 
-    if TEST_OUT_PATH.exists():
-        shutil.rmtree(TEST_OUT_PATH)
-    TEST_OUT_PATH.mkdir()
-
-    cpacs = CPACS(CPACS_IN_PATH)
-
-    export_brep(cpacs, TEST_OUT_PATH)
-
-    generate_gmsh(
-        cpacs=cpacs,
+    su2mesh_path, _ = generate_gmsh(
+        cpacs=simpletest_cpacs,
         cpacs_path=CPACS_IN_PATH,
-        brep_dir=TEST_OUT_PATH,
-        results_dir=TEST_OUT_PATH,
+        brep_dir=simpletest_brep_dir,
+        results_dir=tmp_path,
         open_gmsh=False,
         farfield_factor=5,
         symmetry=True,
@@ -126,20 +150,17 @@ def test_generate_gmsh_symm():
         testing_gmsh=False,
     )
 
-    mesh_markers = get_mesh_markers(Path(TEST_OUT_PATH, "mesh.su2"))
+    mesh_markers = get_mesh_markers(su2mesh_path)
     assert mesh_markers["wall"] == ["SimpleFuselage", "Wing"]
     assert mesh_markers["symmetry"] == ["symmetry"]
     assert mesh_markers["farfield"] == ["Farfield"]
 
-    remove_file_type_in_dir(TEST_OUT_PATH, [".brep", ".su2", ".cfg"])
-
 
 def test_get_entities_from_volume():
     """
     Test on a simple cube if the lower dimensions entities are correctly found.
     """
 
-    gmsh.initialize()
     test_cube = gmsh.model.occ.addBox(0, 0, 0, 1, 1, 1)
     gmsh.model.occ.synchronize()
     surfaces_dimtags, lines_dimtags, points_dimtags = get_entities_from_volume([(3, test_cube)])
@@ -149,8 +170,6 @@ def test_get_entities_from_volume():
     assert surfaces_dimtags == [(2, 1), (2, 2), (2, 3), (2, 4), (2, 5), (2, 6)]
     assert lines_dimtags == [(1, i) for i in range(1, 13)]
     assert points_dimtags == [(0, i) for i in range(1, 9)]
-    gmsh.clear()
-    gmsh.finalize()
 
 
 def test_ModelPart_associate_child_to_parent():
@@ -158,7 +177,6 @@ def test_ModelPart_associate_child_to_parent():
     Test if the ModelPart associate_child_to_parent function works correctly.
     """
 
-    gmsh.initialize()
     cube_child_tag = gmsh.model.occ.addBox(0, 0, 0, 1, 1, 1)
     gmsh.model.occ.synchronize()
     model_part = ModelPart("cube_parent")
@@ -170,14 +188,10 @@ def test_ModelPart_associate_child_to_parent():
     assert len(model_part.lines_tags) == 12
     assert len(model_part.points_tags) == 8
 
-    gmsh.clear()
-    gmsh.finalize()
-
 
 def test_ModelPart_clean_inside_entities():
     """Test if the ModelPart clean_inside_entities function works correctly."""
 
-    gmsh.initialize()
     final_domain_tag = gmsh.model.occ.addBox(0, 0, 0, 1, 1, 1)
     gmsh.model.occ.synchronize()
     final_domain = ModelPart("fluid")
@@ -195,29 +209,18 @@ def test_ModelPart_clean_inside_entities():
     assert len(model_part.lines_tags) == 0
     assert len(model_part.points_tags) == 0
 
-    gmsh.clear()
-    gmsh.finalize()
 
-
-def test_assignation():
+def test_assignation(simpletest_cpacs, simpletest_brep_dir, tmp_path):
     """
     Test if the assignation mechanism is correct on all parts
     test if the assignation of the entities of wing1 is correct
     """
 
-    if TEST_OUT_PATH.exists():
-        shutil.rmtree(TEST_OUT_PATH)
-    TEST_OUT_PATH.mkdir()
-
-    cpacs = CPACS(CPACS_IN_PATH)
-
-    export_brep(cpacs, TEST_OUT_PATH)
-
     _, aircraft_parts = generate_gmsh(
-        cpacs=cpacs,
+        cpacs=simpletest_cpacs,
         cpacs_path=CPACS_IN_PATH,
-        brep_dir=TEST_OUT_PATH,
-        results_dir=TEST_OUT_PATH,
+        brep_dir=simpletest_brep_dir,
+        results_dir=tmp_path,
         open_gmsh=False,
         farfield_factor=5,
         symmetry=False,
@@ -255,28 +258,22 @@ def test_assignation():
             assert part.lines_tags == wing1_lines_tags
             assert part.points_tags == wing1_points_tags
 
-    remove_file_type_in_dir(TEST_OUT_PATH, [".brep", ".su2", ".cfg"])
-
 
-def test_define_engine_bc():
+def test_define_engine_bc(tmp_path):
     """
     Test if the engine bc are correctly assigned
 
     """
 
-    if TEST_OUT_PATH.exists():
-        shutil.rmtree(TEST_OUT_PATH)
-    TEST_OUT_PATH.mkdir()
-
     cpacs = CPACS(CPACS_IN_SIMPLE_ENGINE_PATH)
 
-    export_brep(cpacs, TEST_OUT_PATH)
+    export_brep(cpacs, tmp_path)
 
     generate_gmsh(
         cpacs=cpacs,
         cpacs_path=CPACS_IN_SIMPLE_ENGINE_PATH,
-        brep_dir=TEST_OUT_PATH,
-        results_dir=TEST_OUT_PATH,
+        brep_dir=tmp_path,
+        results_dir=tmp_path,
         open_gmsh=False,
         farfield_factor=2,
         symmetry=False,
@@ -317,31 +314,21 @@ def test_define_engine_bc():
     assert gmsh.model.getEntitiesForPhysicalGroup(*physical_groups[6]) == [44]
     assert gmsh.model.getEntitiesForPhysicalGroup(*physical_groups[7]) == [43]
 
-    # End gmsh api
-    gmsh.clear()
-    gmsh.finalize()
-
-    remove_file_type_in_dir(TEST_OUT_PATH, [".brep", ".su2", ".cfg"])
-
 
-def test_define_doubleflux_engine_bc():
+def test_define_doubleflux_engine_bc(tmp_path):
     """
     Test if doubleflux engine bc are correctly assigned
     """
 
-    if TEST_OUT_PATH.exists():
-        shutil.rmtree(TEST_OUT_PATH)
-    TEST_OUT_PATH.mkdir()
-
     cpacs = CPACS(CPACS_IN_SIMPLE_DOUBLEFLUX_ENGINE_PATH)
 
-    export_brep(cpacs, TEST_OUT_PATH)
+    export_brep(cpacs, tmp_path)
 
     generate_gmsh(
         cpacs=cpacs,
         cpacs_path=CPACS_IN_SIMPLE_ENGINE_PATH,
-        brep_dir=TEST_OUT_PATH,
-        results_dir=TEST_OUT_PATH,
+        brep_dir=tmp_path,
+        results_dir=tmp_path,
         open_gmsh=False,
         farfield_factor=3,
         symmetry=False,
@@ -378,31 +365,21 @@ def test_define_doubleflux_engine_bc():
     assert gmsh.model.getEntitiesForPhysicalGroup(*physical_groups[8]) == [46]
     assert gmsh.model.getEntitiesForPhysicalGroup(*physical_groups[9]) == [51]
 
-    # End gmsh api
-    gmsh.clear()
-    gmsh.finalize()
-
-    remove_file_type_in_dir(TEST_OUT_PATH, [".brep", ".su2", ".cfg"])
-
 
-def test_disk_actuator_conversion():
+def test_disk_actuator_conversion(tmp_path):
     """
     Test if disk actuator conversion is working on the simple_propeller.xml
     by testing the physical groups
     """
-    if TEST_OUT_PATH.exists():
-        shutil.rmtree(TEST_OUT_PATH)
-    TEST_OUT_PATH.mkdir()
-
     cpacs = CPACS(CPACS_IN_PROPELLER_ENGINE_PATH)
 
-    export_brep(cpacs, TEST_OUT_PATH)
+    export_brep(cpacs, tmp_path)
 
     generate_gmsh(
         cpacs=cpacs,
         cpacs_path=CPACS_IN_PROPELLER_ENGINE_PATH,
-        brep_dir=TEST_OUT_PATH,
-        results_dir=TEST_OUT_PATH,
+        brep_dir=tmp_path,
+        results_dir=tmp_path,
         open_gmsh=False,
         farfield_factor=3,
         symmetry=False,
@@ -429,12 +406,6 @@ def test_disk_actuator_conversion():
     assert gmsh.model.getPhysicalName(*physical_groups[8]) == "Propeller_AD_Outlet"
     assert gmsh.model.getPhysicalName(*physical_groups[9]) == "Propeller_mirrored_AD_Outlet"
 
-    # End gmsh api
-    gmsh.clear()
-    gmsh.finalize()
-
-    remove_file_type_in_dir(TEST_OUT_PATH, [".brep", ".su2", ".cfg"])
-
 
 # =================================================================================================
 #    MAIN
@@ -16,7 +16,6 @@ Python version: >=3.8
 #   IMPORTS
 # =================================================================================================
 
-import shutil
 from pathlib import Path
 
 import gmsh
@@ -27,13 +26,10 @@ from ceasiompy.CPACS2GMSH.func.wingclassification import (
     detect_normal_profile,
     detect_truncated_profile,
 )
-from ceasiompy.utils.ceasiompyutils import remove_file_type_in_dir
 from ceasiompy.utils.commonpaths import CPACS_FILES_PATH
 from cpacspy.cpacspy import CPACS
 
-MODULE_DIR = Path(__file__).parent
 CPACS_IN_PATH = Path(CPACS_FILES_PATH, "simpletest_cpacs.xml")
-TEST_OUT_PATH = Path(MODULE_DIR, "ToolOutput")
 
 # =================================================================================================
 #   CLASSES
@@ -215,7 +211,7 @@ def test_detect_truncated_profile():
     gmsh.finalize()
 
 
-def test_classify_wing():
+def test_classify_wing(tmp_path):
     """
     Test if one of the wing of the simple test model is correctly classified
 
@@ -223,19 +219,15 @@ def test_classify_wing():
     classified
     """
 
-    if TEST_OUT_PATH.exists():
-        shutil.rmtree(TEST_OUT_PATH)
-    TEST_OUT_PATH.mkdir()
-
     cpacs = CPACS(CPACS_IN_PATH)
 
-    export_brep(cpacs, TEST_OUT_PATH)
+    export_brep(cpacs, tmp_path)
 
     _, aircraft_parts = generate_gmsh(
         cpacs=cpacs,
         cpacs_path=CPACS_IN_PATH,
-        brep_dir=TEST_OUT_PATH,
-        results_dir=TEST_OUT_PATH,
+        brep_dir=tmp_path,
+        results_dir=tmp_path,
         open_gmsh=False,
         farfield_factor=2,
         symmetry=False,
@@ -264,8 +256,6 @@ def test_classify_wing():
     assert section1["lines_tags"] == [21, 23, 25]
     assert pytest.approx(section1["mean_chord"], 0.01) == 1
 
-    remove_file_type_in_dir(TEST_OUT_PATH, [".brep", ".su2", ".cfg"])
-
 
 # =================================================================================================
 #    MAIN
@@ -18,6 +18,7 @@ TODO:
 #   IMPORTS
 # =================================================================================================
 
+import mmap
 import re
 from pathlib import Path
 
@@ -75,13 +76,21 @@ def get_mesh_markers(su2_mesh_path):
         "wall": [],
     }
 
-    with open(su2_mesh_path) as f:
-        lines = f.readlines()
-
-    for line in lines:
-
-        if "MARKER_TAG" not in line:
-            continue
+    # The mesh file is memory-mapped and only the 'MARKER_TAG' lines are decoded, this avoids
+    # reading all the lines of (potentially very large) meshes
+    marker_lines = []
+    if su2_mesh_path.stat().st_size:
+        with open(su2_mesh_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = mm.find(b"MARKER_TAG")
+                while pos != -1:
+                    end = mm.find(b"\n", pos)
+                    if end == -1:
+                        end = mm.size()
+                    marker_lines.append(mm[pos:end].decode())
+                    pos = mm.find(b"MARKER_TAG", end)
+
+    for line in marker_lines:
 
         marker = line.split("=")[1].strip()
 
@@ -79,6 +79,35 @@ def test_get_mesh_marker():
     assert mesh_markers["symmetry"] == ["None"]
 
 
+@pytest.mark.parametrize(
+    "mesh_content",
+    [
+        b"NDIME= 3\nNMARK= 2\nMARKER_TAG= Farfield\nMARKER_ELEMS= 1\nMARKER_TAG= Wing",
+        b"NDIME= 3\r\nNMARK= 2\r\nMARKER_TAG= Farfield\r\nMARKER_ELEMS= 1\r\nMARKER_TAG= Wing\r\n",
+    ],
+    ids=["no_trailing_newline", "crlf"],
+)
+def test_get_mesh_marker_line_endings(tmp_path, mesh_content):
+    """Test 'get_mesh_markers' with a last marker without newline and with CRLF line endings"""
+
+    su2_mesh = Path(tmp_path, "mesh.su2")
+    su2_mesh.write_bytes(mesh_content)
+
+    mesh_markers = get_mesh_markers(su2_mesh)
+    assert mesh_markers["farfield"] == ["Farfield"]
+    assert mesh_markers["wall"] == ["Wing"]
+
+
+def test_get_mesh_marker_empty_file(tmp_path):
+    """Test 'get_mesh_markers' with an empty mesh file"""
+
+    su2_mesh = Path(tmp_path, "empty_mesh.su2")
+    su2_mesh.touch()
+
+    with pytest.raises(ValueError):
+        get_mesh_markers(su2_mesh)
+
+
 def test_get_su2_version():
     """Test function 'get_su2_version'"""
 
@@ -20,6 +20,7 @@ TODO:
 
 from pathlib import Path
 
+import numpy as np
 from ceasiompy.utils.ceasiomlogger import get_logger
 from ceasiompy.utils.ceasiompyutils import get_aeromap_list_from_xpath, get_results_directory
 from ceasiompy.utils.commonxpath import (
@@ -35,6 +36,7 @@ from ceasiompy.utils.moduleinterfaces import (
 )
 from cpacspy.cpacsfunctions import get_value_or_default
 from cpacspy.cpacspy import CPACS
+from cpacspy.utils import MSG_STAB_NEUTRAL
 from markdownpy.markdownpy import MarkdownDoc, Table
 
 log = get_logger()
@@ -49,6 +51,80 @@ STABILITY_DICT = {True: "Stable", False: "Unstable", None: "Not define"}
 # =================================================================================================
 
 
+def get_stability_slopes(df, group_by, x_col, y_col):
+    """Get the slope of the linear regression of 'y_col' vs 'x_col' for every flight condition
+    defined by the 'group_by' parameters. All the slopes are computed at once with the closed-form
+    degree-1 least squares, instead of fitting the flight conditions one by one.
+
+    Args:
+        df (DataFrame): Aeromap dataframe
+        group_by (list): Parameters which define a flight condition
+        x_col (str): Varying parameter of each flight condition (aoa or aos)
+        y_col (str): Moment coefficient
+
+    Returns:
+        conditions (list): Values of the 'group_by' parameters of each flight condition with at
+                           least two different values of 'x_col'
+        slopes (ndarray): Slope of each of these flight conditions
+    """
+
+    grouped = df.groupby(group_by)
+    n_cond = grouped.ngroups
+
+    # Rows with a NaN in the 'group_by' parameters are not part of any group (NaN or -1 index)
+    cond_idx = grouped.ngroup().fillna(-1).to_numpy()
+    valid = cond_idx >= 0
+    cond_idx = cond_idx[valid].astype(int)
+
+    x = df[x_col].to_numpy(dtype=float)[valid]
+    y = df[y_col].to_numpy(dtype=float)[valid]
+
+    count = np.bincount(cond_idx, minlength=n_cond)
+    dx = x - (np.bincount(cond_idx, weights=x, minlength=n_cond) / count)[cond_idx]
+    dy = y - (np.bincount(cond_idx, weights=y, minlength=n_cond) / count)[cond_idx]
+    ssx = np.bincount(cond_idx, weights=dx * dx, minlength=n_cond)
+    sxy = np.bincount(cond_idx, weights=dx * dy, minlength=n_cond)
+
+    # At least two different values of 'x_col' are needed to check the stability
+    x_range = grouped[x_col].agg(["min", "max"])
+    enough = (x_range["min"] != x_range["max"]).to_numpy()
+
+    slopes = sxy / np.where(enough, ssx, 1.0)
+
+    # The group means are not exact, so force the slope of a constant 'y_col' (without NaN) to
+    # exactly 0, as the linear regression of cpacspy does, for it to be detected as neutral
+    y_range = grouped[y_col].agg(["min", "max", "count"])
+    flat = ((y_range["min"] == y_range["max"]) & (y_range["count"] == count)).to_numpy()
+    slopes[flat] = 0.0
+
+    conditions = [cond for cond, is_enough in zip(x_range.index, enough) if is_enough]
+
+    return conditions, slopes[enough]
+
+
+def check_stability(slopes, stable_if_negative=True):
+    """Check the stability of flight conditions from the slopes of their moment coefficient. It
+    follows the rules of the 'check_*_stability' methods of cpacspy aeromap (a slope of exactly 0
+    is neutral), but classifies all the slopes at once with boolean masks.
+
+    Args:
+        slopes (ndarray): Slopes of the moment coefficient vs the varying parameter
+        stable_if_negative (bool): True if a negative slope is stable, False if a positive one is
+
+    Returns:
+        stability (list): Stability of each flight condition (neutral is considered as unstable)
+        comments (list): Comment for each flight condition
+    """
+
+    stable = slopes < 0 if stable_if_negative else slopes > 0
+    neutral = slopes == 0
+
+    stability = np.where(stable, STABILITY_DICT[True], STABILITY_DICT[False]).tolist()
+    comments = np.where(neutral, MSG_STAB_NEUTRAL, "").tolist()
+
+    return stability, comments
+
+
 def generate_longitudinal_stab_table(aeromap):
     """Generate the Markdownpy Table for the longitudinal stability to show in the results.
 
@@ -58,13 +134,14 @@ def generate_longitudinal_stab_table(aeromap):
 
     stability_table = [["mach", "alt", "aos", "Longitudinal stability", "Comment"]]
 
-    for (mach, alt, aos), _ in aeromap.df.groupby(["machNumber", "altitude", "angleOfSideslip"]):
-        stable, msg = aeromap.check_longitudinal_stability(alt=alt, mach=mach, aos=aos)
+    conditions, slopes = get_stability_slopes(
+        aeromap.df, ["machNumber", "altitude", "angleOfSideslip"], "angleOfAttack", "cms"
+    )
 
-        if stable is None:
-            continue
+    stabilities, comments = check_stability(slopes)
 
-        stability_table.append([str(mach), str(alt), str(aos), STABILITY_DICT[stable], msg])
+    for (mach, alt, aos), stability, comment in zip(conditions, stabilities, comments):
+        stability_table.append([str(mach), str(alt), str(aos), stability, comment])
 
     return stability_table
 
@@ -78,13 +155,15 @@ def generate_directional_stab_table(aeromap):
 
     stability_table = [["mach", "alt", "aoa", "Directional stability", "Comment"]]
 
-    for (mach, alt, aoa), _ in aeromap.df.groupby(["machNumber", "altitude", "angleOfAttack"]):
-        stable, msg = aeromap.check_directional_stability(alt=alt, mach=mach, aoa=aoa)
+    conditions, slopes = get_stability_slopes(
+        aeromap.df, ["machNumber", "altitude", "angleOfAttack"], "angleOfSideslip", "cml"
+    )
 
-        if stable is None:
-            continue
+    # With the CPACS angle convention cml vs aos slope must be positive to be stable
+    stabilities, comments = check_stability(slopes, stable_if_negative=False)
 
-        stability_table.append([str(mach), str(alt), str(aoa), STABILITY_DICT[stable], msg])
+    for (mach, alt, aoa), stability, comment in zip(conditions, stabilities, comments):
+        stability_table.append([str(mach), str(alt), str(aoa), stability, comment])
 
     return stability_table
 
@@ -98,53 +177,65 @@ def generate_lateral_stab_table(aeromap):
 
     stability_table = [["mach", "alt", "aoa", "Lateral stability", "Comment"]]
 
-    for (mach, alt, aoa), _ in aeromap.df.groupby(["machNumber", "altitude", "angleOfAttack"]):
-        stable, msg = aeromap.check_lateral_stability(alt=alt, mach=mach, aoa=aoa)
+    conditions, slopes = get_stability_slopes(
+        aeromap.df, ["machNumber", "altitude", "angleOfAttack"], "angleOfSideslip", "cmd"
+    )
 
-        if stable is None:
-            continue
+    stabilities, comments = check_stability(slopes)
 
-        stability_table.append([str(mach), str(alt), str(aoa), STABILITY_DICT[stable], msg])
+    for (mach, alt, aoa), stability, comment in zip(conditions, stabilities, comments):
+        stability_table.append([str(mach), str(alt), str(aoa), stability, comment])
 
     return stability_table
 
 
-def static_stability_analysis(cpacs_path, cpacs_out_path):
-    """Function 'static_stability_analysis' analyses longitudinal, directional and lateral
-    stability.
+def static_stability_analysis_from_cpacs(cpacs):
+    """Function 'static_stability_analysis_from_cpacs' analyses longitudinal, directional and
+    lateral stability of the aeromaps of an already open CPACS. The CPACS file is neither read nor
+    written, so the caller can keep working on the same CPACS object.
 
     Args:
-        cpacs_path (str): Path to CPACS file
-        cpacs_out_path (str):Path to CPACS output file
+        cpacs (object): CPACS object from cpacspy
 
     """
 
-    cpacs = CPACS(cpacs_path)
+    aeromap_uid_list = get_aeromap_list_from_xpath(cpacs, STABILITY_AEROMAP_TO_ANALYZE_XPATH)
 
     results_dir = get_results_directory("StaticStability")
     md = MarkdownDoc(Path(results_dir, "Static_stability.md"))
     md.h2("Static stability")
 
-    for aeromap_uid in get_aeromap_list_from_xpath(cpacs, STABILITY_AEROMAP_TO_ANALYZE_XPATH):
+    # Nothing to analyse, the options are not read because 'get_value_or_default' would write
+    # their default value in the CPACS
+    if not aeromap_uid_list:
+        md.save()
+        return
+
+    # Options are read once for all aeromaps
+    check_longitudinal = get_value_or_default(cpacs.tixi, CHECK_LONGITUDINAL_STABILITY_XPATH, True)
+    check_directional = get_value_or_default(cpacs.tixi, CHECK_DIRECTIONAL_STABILITY_XPATH, False)
+    check_lateral = get_value_or_default(cpacs.tixi, CHECK_LATERAL_STABILITY_XPATH, False)
+
+    for aeromap_uid in aeromap_uid_list:
 
         md.h4(f"Static stability of '{aeromap_uid}' aeromap")
         aeromap = cpacs.get_aeromap_by_uid(aeromap_uid)
 
-        if get_value_or_default(cpacs.tixi, CHECK_LONGITUDINAL_STABILITY_XPATH, True):
+        if check_longitudinal:
 
             table = generate_longitudinal_stab_table(aeromap)
             if len(table) > 1:
                 md.p(Table(table).write())
                 md.line()
 
-        if get_value_or_default(cpacs.tixi, CHECK_DIRECTIONAL_STABILITY_XPATH, False):
+        if check_directional:
 
             table = generate_directional_stab_table(aeromap)
             if len(table) > 1:
                 md.p(Table(table).write())
                 md.line()
 
-        if get_value_or_default(cpacs.tixi, CHECK_LATERAL_STABILITY_XPATH, False):
+        if check_lateral:
 
             table = generate_lateral_stab_table(aeromap)
             if len(table) > 1:
@@ -152,6 +243,22 @@ def static_stability_analysis(cpacs_path, cpacs_out_path):
                 md.line()
 
     md.save()
+
+
+def static_stability_analysis(cpacs_path, cpacs_out_path):
+    """Function 'static_stability_analysis' analyses longitudinal, directional and lateral
+    stability.
+
+    Args:
+        cpacs_path (str): Path to CPACS file
+        cpacs_out_path (str):Path to CPACS output file
+
+    """
+
+    cpacs = CPACS(cpacs_path)
+
+    static_stability_analysis_from_cpacs(cpacs)
+
     cpacs.save_cpacs(cpacs_out_path, overwrite=True)
 
 
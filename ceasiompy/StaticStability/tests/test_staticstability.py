@@ -20,15 +20,21 @@ TODO:
 
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 from ceasiompy.StaticStability.staticstability import (
+    check_stability,
     generate_directional_stab_table,
     generate_lateral_stab_table,
     generate_longitudinal_stab_table,
+    get_stability_slopes,
     static_stability_analysis,
+    static_stability_analysis_from_cpacs,
 )
 from ceasiompy.utils.ceasiompyutils import get_results_directory
 from ceasiompy.utils.commonpaths import CPACS_FILES_PATH
 from cpacspy.cpacspy import CPACS
+from cpacspy.utils import MSG_STAB_NEUTRAL
 
 MODULE_DIR = Path(__file__).parent
 MODULE_NAME = MODULE_DIR.name
@@ -46,6 +52,60 @@ CPACS_OUT_PATH = Path(MODULE_DIR, "D150_simple_staticstability_test_output.xml")
 # =================================================================================================
 
 
+def test_get_stability_slopes():
+    """Test function 'get_stability_slopes'"""
+
+    df = pd.DataFrame(
+        {
+            "machNumber": [0.3, 0.3, 0.3, 0.5, 0.5, 0.7, 0.9, 0.9, 0.9, np.nan, np.nan],
+            "angleOfAttack": [0.0, 5.0, 10.0, 0.0, 10.0, 5.0, 0.0, 5.0, 10.0, 0.0, 5.0],
+            "cms": [0.2, 0.1, 0.0, 0.1, 0.3, 0.1, 0.1, np.nan, 0.1, 0.5, 0.3],
+        }
+    )
+
+    conditions, slopes = get_stability_slopes(df, ["machNumber"], "angleOfAttack", "cms")
+
+    # Mach 0.7 has only one angle of attack, so its slope can not be computed, and rows with a
+    # NaN Mach number are not part of any flight condition
+    assert conditions == [0.3, 0.5, 0.9]
+    assert np.allclose(slopes[:2], [-0.02, 0.02])
+
+    # A NaN coefficient gives a NaN slope, even if the other values are constant
+    assert np.isnan(slopes[2])
+
+    # A constant coefficient must give a slope of exactly 0, even with irregular and repeated
+    # angles of attack for which the group means are not exact
+    df_flat = pd.DataFrame(
+        {
+            "machNumber": [0.3] * 9,
+            "angleOfAttack": [4.0, 4.0, -2.0, 4.0, 4.0, 4.0, 0.0, 4.0, 0.0],
+            "cms": [0.1] * 9,
+        }
+    )
+
+    conditions, slopes = get_stability_slopes(df_flat, ["machNumber"], "angleOfAttack", "cms")
+
+    assert conditions == [0.3]
+    assert slopes[0] == 0.0
+    assert check_stability(slopes) == (["Unstable"], [MSG_STAB_NEUTRAL])
+
+
+def test_check_stability():
+    """Test function 'check_stability'"""
+
+    slopes = np.array([-0.02, 0.02, 0.0, np.nan])
+
+    assert check_stability(slopes) == (
+        ["Stable", "Unstable", "Unstable", "Unstable"],
+        ["", "", MSG_STAB_NEUTRAL, ""],
+    )
+    assert check_stability(slopes, stable_if_negative=False) == (
+        ["Unstable", "Stable", "Unstable", "Unstable"],
+        ["", "", MSG_STAB_NEUTRAL, ""],
+    )
+    assert check_stability(np.array([])) == ([], [])
+
+
 class TestGenerateTable:
 
     cpacs = CPACS(CPACS_IN)
@@ -65,6 +125,12 @@ class TestGenerateTable:
             ["0.3", "0.0", "10.0", "Unstable", ""],
         ]
 
+        # There is no cms in this aeromap, so the slopes are NaN and reported as unstable
+        _, slopes = get_stability_slopes(
+            self.aeromap.df, ["machNumber", "altitude", "angleOfSideslip"], "angleOfAttack", "cms"
+        )
+        assert np.isnan(slopes).all()
+
         self.aeromap.add_row(mach=0.3, alt=0, aos=5.0, aoa=0, cd=0.001, cl=1.1, cs=0.22, cms=0.22)
         self.aeromap.add_row(mach=0.3, alt=0, aos=5.0, aoa=4, cd=0.001, cl=1.1, cs=0.22, cms=0.12)
         table = generate_longitudinal_stab_table(self.aeromap)
@@ -75,6 +141,26 @@ class TestGenerateTable:
             ["0.3", "0.0", "10.0", "Unstable", ""],
         ]
 
+    def test_generate_longitudinal_stab_table_neutral(self):
+        """Test function 'generate_longitudinal_stab_table' with a constant cms"""
+
+        aeromap = CPACS(CPACS_IN).get_aeromap_by_uid("aeromap_empty")
+        aeromap.df = pd.DataFrame(
+            {
+                "altitude": [0.0] * 9,
+                "machNumber": [0.3] * 9,
+                "angleOfSideslip": [0.0] * 9,
+                "angleOfAttack": [4.0, 4.0, -2.0, 4.0, 4.0, 4.0, 0.0, 4.0, 0.0],
+                "cms": [0.1] * 9,
+            }
+        )
+
+        table = generate_longitudinal_stab_table(aeromap)
+        assert table == [
+            ["mach", "alt", "aos", "Longitudinal stability", "Comment"],
+            ["0.3", "0.0", "0.0", "Unstable", MSG_STAB_NEUTRAL],
+        ]
+
     def test_generate_directional_stab_table(self):
         """Test function 'generate_directional_stab_table'"""
 
@@ -127,6 +213,24 @@ class TestGenerateTable:
         ]
 
 
+def test_static_stability_analysis_from_cpacs():
+    """Test Function 'static_stability_analysis_from_cpacs'"""
+
+    results_dir = get_results_directory("StaticStability")
+    result_markdown_file = Path(results_dir, "Static_stability.md")
+
+    if result_markdown_file.exists():
+        result_markdown_file.unlink()
+
+    if CPACS_OUT_PATH.exists():
+        CPACS_OUT_PATH.unlink()
+
+    static_stability_analysis_from_cpacs(CPACS(CPACS_IN))
+
+    assert result_markdown_file.exists()
+    assert not CPACS_OUT_PATH.exists()
+
+
 def test_static_stability_analysis():
     """Test Function 'static_stability_analysis'"""
 
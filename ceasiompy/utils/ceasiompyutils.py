@@ -351,17 +351,23 @@ def remove_file_type_in_dir(directory: Path, file_type_list: List[str]) -> None:
 
     Args:
         directory (Path): Path to the directory
-        file_type_list (List[str]): List of file types to remove.
+        file_type_list (List[str]): List of file types to remove (a single file type as a string
+                                    is also accepted).
 
     """
 
     if not directory.exists():
         raise FileNotFoundError(f"The directory {directory} does not exist!")
 
+    # A single string must not be split into characters by 'set'
+    if isinstance(file_type_list, str):
+        file_type_list = [file_type_list]
+
+    file_types = set(file_type_list)
+
+    # Check the suffix (string operation) before 'is_file' (filesystem call)
     for file in directory.iterdir():
-        if not file.is_file():
-            continue
-        if file.suffix in file_type_list:
+        if file.suffix in file_types and file.is_file():
             file.unlink()
 
 
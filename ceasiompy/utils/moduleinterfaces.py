@@ -21,8 +21,7 @@ TODO:
 
 
 import importlib
-import inspect
-import uuid
+import sys
 from pathlib import Path
 
 from ceasiompy.utils.ceasiomlogger import get_logger
@@ -36,6 +35,12 @@ MODULE_DIR = Path(__file__).parent
 MODNAME_TOP = "ceasiompy"
 MODNAME_SPECS = "__specs__"
 
+# Module lists already computed by 'get_module_list' {only_active: (mtime_ns, module_names)}
+_MODULE_LIST_CACHE = {}
+
+# __specs__ modules already imported by 'get_specs_for_module' {module_name: specs}
+_MODULE_SPECS_CACHE = {}
+
 # =================================================================================================
 #   CLASSES
 # =================================================================================================
@@ -47,12 +52,14 @@ class CPACSRequirementError(Exception):
 
 class _Entry:
 
-    ONLY_INPUT = [
-        "default_value",
-        "gui",
-        "gui_group",
-        "gui_name",
-    ]
+    ONLY_INPUT = frozenset(
+        {
+            "default_value",
+            "gui",
+            "gui_group",
+            "gui_name",
+        }
+    )
 
     def __init__(
         self,
@@ -89,11 +96,27 @@ class _Entry:
         self.descr = descr
         self.xpath = xpath
 
+        # Parent xpath and name of the leaf node (ignoring one trailing "/"), split once here
+        node_xpath = xpath[:-1] if xpath.endswith("/") else xpath
+        self._xpath_parent, _, self._xpath_leaf = node_xpath.rpartition("/")
+
         # GUI specific
         self.gui = gui
         self.gui_name = gui_name
         self.gui_group = gui_group
 
+    @property
+    def xpath_parent(self):
+        """Xpath of the parent node of the entry"""
+
+        return self._xpath_parent
+
+    @property
+    def xpath_leaf(self):
+        """Name of the leaf node of the entry"""
+
+        return self._xpath_leaf
+
 
 class CPACSInOut:
     def __init__(self):
@@ -117,8 +140,8 @@ class CPACSInOut:
     def add_output(self, **kwargs):
         """Add a new entry to the outputs list"""
 
-        for entry_name in _Entry.ONLY_INPUT:
-            if kwargs.get(entry_name, None) is not None:
+        for entry_name in sorted(_Entry.ONLY_INPUT & kwargs.keys()):
+            if kwargs[entry_name] is not None:
                 raise ValueError(f"Output '{entry_name}' must be None")
 
         entry = _Entry(**kwargs)
@@ -128,12 +151,11 @@ class CPACSInOut:
         """Return a dictionary which can be processed by the GUI engine"""
 
         gui_settings_dict = {}
-        for entry in self.inputs:
-            if not entry.gui:
-                continue
+        gui_entries = (entry for entry in self.inputs if entry.gui)
 
-            # Every GUI element is identified by a random key
-            gui_settings_dict[str(uuid.uuid4())] = (
+        # Every GUI element is identified by a key, which only has to be unique in this dict
+        for i, entry in enumerate(gui_entries):
+            gui_settings_dict[str(i)] = (
                 entry.gui_name,
                 entry.default_value,
                 entry.var_type,
@@ -188,10 +210,10 @@ def check_cpacs_input_requirements(
     # If 'cpacs_inout' not provided by caller, we try to determine it
     if cpacs_inout is None:
         if module_name is None:
-            # Get the path of the caller submodule
-            frm = inspect.stack()[1]
-            mod = inspect.getmodule(frm[0])
-            caller_module_path = Path(mod.__file__).parent
+            # Get the path of the caller submodule (only the caller frame is needed, contrary to
+            # 'inspect.stack()' which would build the info of every frame of the stack)
+            caller_frame = sys._getframe(1)
+            caller_module_path = Path(caller_frame.f_globals["__file__"]).parent
 
             # Get the CEASIOM_XPATH submodule name
             module_name = caller_module_path.name
@@ -203,13 +225,12 @@ def check_cpacs_input_requirements(
         cpacs_inout = specs_module.cpacs_inout
 
     tixi = open_tixi(cpacs_file)
-    missing_nodes = []
-    for entry in cpacs_inout.inputs:
-
-        if entry.default_value is not None:
-            continue
-        if tixi.checkElement(entry.xpath) is False:
-            missing_nodes.append(entry.xpath)
+    check_element = tixi.checkElement
+    missing_nodes = [
+        entry.xpath
+        for entry in cpacs_inout.inputs
+        if entry.default_value is None and not check_element(entry.xpath)
+    ]
 
     if missing_nodes:
         for missing in missing_nodes:
@@ -223,10 +244,28 @@ def get_module_list(only_active=True):
 
     ['SkinFriction', 'PyTornado', ...]
 
+    Note:
+        * The result is cached, the modules directory is only scanned again if its
+          modification time has changed
+
     Returns:
         A list of module names (as strings)
     """
 
+    only_active = bool(only_active)
+    mtime_ns = MODULES_DIR_PATH.stat().st_mtime_ns
+
+    cached = _MODULE_LIST_CACHE.get(only_active)
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, _scan_module_list(only_active))
+        _MODULE_LIST_CACHE[only_active] = cached
+
+    return list(cached[1])
+
+
+def _scan_module_list(only_active):
+    """Return a tuple of CEASIOMpy module names, see 'get_module_list'."""
+
     module_list = []
     for module_dir in MODULES_DIR_PATH.iterdir():
         module_name = module_dir.name
@@ -251,7 +290,7 @@ def get_module_list(only_active=True):
         else:
             module_list.append(module_name)
 
-    return module_list
+    return tuple(module_list)
 
 
 def get_toolinput_file_path(module_name):
@@ -285,23 +324,33 @@ def get_tooloutput_file_path(module_name):
 def get_specs_for_module(module_name, raise_error=False):
     """Return the __specs__ module for a CEASIOMpy module
 
+    Note:
+        * The result is cached for each module name, but only if the import succeeded, so a
+          module whose __specs__ could not be imported is tried again at the next call
+
     Args:
         module_name (str): name of the module as a string
         raise_error (bool): 'True' if error should be raised
                             if __specs__ does not exist
     """
 
-    if not module_name.startswith("ceasiompy."):
-        module_name = ".".join((MODNAME_TOP, module_name))
+    if not module_name.startswith(f"{MODNAME_TOP}."):
+        module_name = f"{MODNAME_TOP}.{module_name}"
 
-    try:
-        specs = importlib.import_module(".".join((module_name, MODNAME_SPECS)))
+    specs = _MODULE_SPECS_CACHE.get(module_name)
+    if specs is not None:
         return specs
+
+    try:
+        specs = importlib.import_module(f"{module_name}.{MODNAME_SPECS}")
     except ImportError:
         if raise_error:
             raise ImportError(f"{MODNAME_SPECS} module not found for {module_name}")
         return None
 
+    _MODULE_SPECS_CACHE[module_name] = specs
+    return specs
+
 
 def get_all_module_specs():
     """Return a dictionary with module names (keys) and specs files (values)
@@ -309,6 +358,8 @@ def get_all_module_specs():
     Note:
         * If the __specs__ module for a CEASIOMpy cannot
           be located the module will be None
+        * All the __specs__ modules are already imported (and cached) by 'get_module_list',
+          so no new import is made here
 
     The dictionary has the form:
 
@@ -323,17 +374,28 @@ def get_all_module_specs():
         all_specs (dict): Dictionary containing all module specs
     """
 
-    all_specs = {}
-    for module_name in get_module_list(only_active=False):
-        specs = get_specs_for_module(module_name, raise_error=False)
-        all_specs[module_name] = specs
-    return all_specs
+    return {
+        module_name: get_specs_for_module(module_name, raise_error=False)
+        for module_name in get_module_list(only_active=False)
+    }
+
+
+def _add_xpath_and_parents(xpath_set, xpath):
+    """Add an xpath and all its parent xpaths to a set of existing xpaths."""
+
+    while xpath and xpath not in xpath_set:
+        xpath_set.add(xpath)
+        xpath = xpath.rpartition("/")[0]
 
 
 def create_default_toolspecific():
     """Create a default XML /toolspecific based on all __spec__ xpath and
     default values. Two CPACS file are created and saved in /utils/doc/
 
+    Note:
+        * Xpaths already visited are tracked in sets, so each branch is only created once and
+          each input node is only checked once with tixi 'checkElement'
+
     """
 
     EMPTY_CPACS_PATH = Path(MODULE_DIR, "doc", "empty_cpacs.xml")
@@ -341,30 +403,39 @@ def create_default_toolspecific():
     tixi_in = open_tixi(EMPTY_CPACS_PATH)
     tixi_out = open_tixi(EMPTY_CPACS_PATH)
 
+    in_xpaths = set()
+    out_xpaths = set()
+
     for _, specs in get_all_module_specs().items():
         if specs is not None:
             # Inputs
             for entry in specs.cpacs_inout.inputs:
 
-                xpath = entry.xpath
-                if xpath.endswith("/"):
-                    xpath = xpath[:-1]
+                xpath = f"{entry.xpath_parent}/{entry.xpath_leaf}"
+                if xpath in in_xpaths:
+                    continue
+                in_xpaths.add(xpath)
 
-                value_name = xpath.split("/")[-1]
-                xpath_parent = xpath[: -(len(value_name) + 1)]
+                # Only checked at the first visit of each node, it could exist in the empty CPACS
+                if tixi_in.checkElement(xpath):
+                    continue
 
-                if not tixi_in.checkElement(xpath):
-                    create_branch(tixi_in, xpath_parent)
-                    if entry.default_value is not None:
-                        value = str(entry.default_value)
-                    else:
-                        value = "No default value"
-                    tixi_in.addTextElement(xpath_parent, value_name, value)
+                if entry.xpath_parent not in in_xpaths:
+                    create_branch(tixi_in, entry.xpath_parent)
+                    _add_xpath_and_parents(in_xpaths, entry.xpath_parent)
+
+                if entry.default_value is not None:
+                    value = str(entry.default_value)
+                else:
+                    value = "No default value"
+                tixi_in.addTextElement(entry.xpath_parent, entry.xpath_leaf, value)
 
             # Outputs
             for entry in specs.cpacs_inout.outputs:
-                xpath = entry.xpath
-                create_branch(tixi_out, xpath)
+
+                if entry.xpath not in out_xpaths:
+                    create_branch(tixi_out, entry.xpath)
+                    _add_xpath_and_parents(out_xpaths, entry.xpath)
 
     TOOLSPECIFIC_INPUT_PATH = Path(MODULE_DIR, "doc", "input_toolspecifics.xml")
     TOOLSPECIFIC_OUTPUT_PATH = Path(MODULE_DIR, "doc", "output_toolspecifics.xml")
@@ -375,21 +446,22 @@ def create_default_toolspecific():
 
 def module_to_remove_from_coverage():
 
-    active_modules = get_module_list(only_active=True)
+    active_modules = set(get_module_list(only_active=True))
 
-    print(
+    lines = [
         "\nYou can copy/paste the following lines in the file /CEASIOMpy/pyproject.toml and "
-        "replace the existing section to remove disabled module from the code coverage.\n"
-    )
-
-    print("[tool.coverage.run]")
-    print("omit = [")
-    print('  "*/__init__.py",')
-    print('  "*/__specs__.py",')
+        "replace the existing section to remove disabled module from the code coverage.\n",
+        "[tool.coverage.run]",
+        "omit = [",
+        '  "*/__init__.py",',
+        '  "*/__specs__.py",',
+    ]
     for module in get_module_list(only_active=False):
         if module not in active_modules and module != "utils":
-            print(f'  "*/{module}/*",')
-    print("]")
+            lines.append(f'  "*/{module}/*",')
+    lines.append("]")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # =================================================================================================
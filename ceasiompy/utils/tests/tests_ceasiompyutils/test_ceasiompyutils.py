@@ -174,6 +174,15 @@ def test_remove_file_type_in_dir():
     assert not test_file_2.exists()
     assert LOGFILE.exists()
 
+    # A single file type can also be given as a string
+    test_file_3 = Path(TMP_DIR, "test_file.txt")
+    test_file_3.touch()
+
+    remove_file_type_in_dir(TMP_DIR, ".txt")
+
+    assert not test_file_3.exists()
+    assert LOGFILE.exists()
+
 
 # =================================================================================================
 #    MAIN
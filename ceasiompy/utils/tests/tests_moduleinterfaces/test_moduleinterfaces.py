@@ -17,13 +17,17 @@ Python version: >=3.8
 # =================================================================================================
 
 
+import shutil
 from pathlib import Path
+from types import SimpleNamespace
 
+import ceasiompy.utils.moduleinterfaces as moduleinterfaces
 import pytest
 from ceasiompy.utils.moduleinterfaces import (
     CPACSInOut,
     CPACSRequirementError,
     check_cpacs_input_requirements,
+    create_default_toolspecific,
     get_all_module_specs,
     get_module_path,
     get_specs_for_module,
@@ -32,7 +36,8 @@ from ceasiompy.utils.moduleinterfaces import (
     get_tooloutput_file_path,
 )
 from ceasiompy.utils.commonpaths import MODULES_DIR_PATH
-from ceasiompy.utils.commonxpath import RANGE_XPATH
+from ceasiompy.utils.commonxpath import AIRCRAFT_NAME_XPATH, RANGE_XPATH
+from cpacspy.cpacsfunctions import create_branch, open_tixi
 
 MODULE_DIR = Path(__file__).parent
 CPACS_TEST_FILE = Path(MODULE_DIR, "ToolInput", "cpacs_test_file.xml")
@@ -100,6 +105,42 @@ def test_cpacs_inout():
     assert len(cpacs_inout.inputs) == 1
     assert len(cpacs_inout.outputs) == 2
 
+    entry = cpacs_inout.inputs[0]
+    assert entry.xpath == "/cpacs/testpath"
+    assert entry.xpath_parent == "/cpacs"
+    assert entry.xpath_leaf == "testpath"
+
+    # Only one trailing "/" is ignored to get the parent and leaf, 'xpath' is not modified
+    cpacs_inout.add_input(xpath="/cpacs/toolspecific/testpath/", default_value=5)
+    entry = cpacs_inout.inputs[-1]
+    assert entry.xpath == "/cpacs/toolspecific/testpath/"
+    assert entry.xpath_parent == "/cpacs/toolspecific"
+    assert entry.xpath_leaf == "testpath"
+
+    # Parent and leaf are read-only
+    with pytest.raises(AttributeError):
+        entry.xpath_parent = "/cpacs"
+
+
+def test_get_gui_dict():
+    """
+    Test that 'get_gui_dict' only returns the GUI entries, with unique keys in order
+    """
+
+    cpacs_inout = CPACSInOut()
+    cpacs_inout.add_input(xpath="/cpacs/a", default_value=1, gui=True, gui_name="A")
+    cpacs_inout.add_input(xpath="/cpacs/b", default_value=2, gui=False, gui_name="B")
+    cpacs_inout.add_input(xpath="/cpacs/c", default_value=3, gui=True, gui_name="C")
+    cpacs_inout.add_input(xpath="/cpacs/d", default_value=4, gui=True, gui_name="D")
+
+    gui_dict = cpacs_inout.get_gui_dict()
+
+    assert list(gui_dict) == ["0", "1", "2"]
+    assert [value[0] for value in gui_dict.values()] == ["A", "C", "D"]
+    assert [value[4] for value in gui_dict.values()] == ["/cpacs/a", "/cpacs/c", "/cpacs/d"]
+
+    assert CPACSInOut().get_gui_dict() == {}
+
 
 def test_check_cpacs_input_requirements():
     """
@@ -152,6 +193,42 @@ def test_get_module_list():
     assert len(module_list_active) < len(module_list)
 
 
+def test_get_module_list_cache(monkeypatch):
+    """
+    Test that 'get_module_list' only scans the modules directory again when its modification
+    time changes and always returns a new list
+    """
+
+    mtime = SimpleNamespace(st_mtime_ns=1)
+    scanned = []
+
+    def fake_scan_module_list(only_active):
+        scanned.append(only_active)
+        return ("ModuleA", "ModuleB")
+
+    monkeypatch.setattr(moduleinterfaces, "_MODULE_LIST_CACHE", {})
+    monkeypatch.setattr(moduleinterfaces, "_scan_module_list", fake_scan_module_list)
+    monkeypatch.setattr(moduleinterfaces, "MODULES_DIR_PATH", SimpleNamespace(stat=lambda: mtime))
+
+    module_list = get_module_list()
+    assert module_list == ["ModuleA", "ModuleB"]
+    assert scanned == [True]
+
+    # Same modification time, the cached list is used
+    module_list.append("ModuleC")
+    assert get_module_list() == ["ModuleA", "ModuleB"]
+    assert scanned == [True]
+
+    # The cache is separated for 'only_active'
+    assert get_module_list(only_active=False) == ["ModuleA", "ModuleB"]
+    assert scanned == [True, False]
+
+    # New modification time, the modules directory is scanned again
+    mtime.st_mtime_ns = 2
+    assert get_module_list() == ["ModuleA", "ModuleB"]
+    assert scanned == [True, False, True]
+
+
 def test_get_toolinput_file_path():
     """
     Test that 'get_toolinput_file_path' works
@@ -194,6 +271,30 @@ def test_get_specs_for_module():
         get_specs_for_module(module_name="SomeModuleThatDoesNotExist", raise_error=True)
 
 
+def test_get_specs_for_module_cache(monkeypatch):
+    """
+    Test that 'get_specs_for_module' caches the imported __specs__, but not a failed import
+    """
+
+    monkeypatch.setattr(moduleinterfaces, "_MODULE_SPECS_CACHE", {})
+
+    def failing_import(name):
+        raise ImportError(name)
+
+    with monkeypatch.context() as m:
+        m.setattr(moduleinterfaces.importlib, "import_module", failing_import)
+        assert get_specs_for_module("ModuleTemplate") is None
+
+    # The failed import has not been cached, so it is tried again
+    specs = get_specs_for_module("ModuleTemplate")
+    assert specs is not None
+
+    # The successful import is cached
+    with monkeypatch.context() as m:
+        m.setattr(moduleinterfaces.importlib, "import_module", failing_import)
+        assert get_specs_for_module("ModuleTemplate") is specs
+
+
 def test_get_all_module_specs():
     """
     Test that 'get_all_module_specs()' runs
@@ -203,13 +304,79 @@ def test_get_all_module_specs():
     assert isinstance(all_specs, dict)
 
 
-def test_create_default_toolspecific():
+def create_default_toolspecific_reference(empty_cpacs_path, input_path, output_path):
+    """Reference implementation of 'create_default_toolspecific' which checks every xpath in
+    tixi, used to test that the optimised function still gives the same files."""
+
+    tixi_in = open_tixi(empty_cpacs_path)
+    tixi_out = open_tixi(empty_cpacs_path)
+
+    for _, specs in moduleinterfaces.get_all_module_specs().items():
+        if specs is not None:
+            for entry in specs.cpacs_inout.inputs:
+
+                xpath = entry.xpath
+                if xpath.endswith("/"):
+                    xpath = xpath[:-1]
+
+                value_name = xpath.split("/")[-1]
+                xpath_parent = xpath[: -(len(value_name) + 1)]
+
+                if not tixi_in.checkElement(xpath):
+                    create_branch(tixi_in, xpath_parent)
+                    if entry.default_value is not None:
+                        value = str(entry.default_value)
+                    else:
+                        value = "No default value"
+                    tixi_in.addTextElement(xpath_parent, value_name, value)
+
+            for entry in specs.cpacs_inout.outputs:
+                create_branch(tixi_out, entry.xpath)
+
+    tixi_in.save(str(input_path))
+    tixi_out.save(str(output_path))
+
+
+def test_create_default_toolspecific(tmp_path, monkeypatch):
     """
-    Test that 'create_default_toolspecific' works
+    Test that 'create_default_toolspecific' gives the same files as the reference implementation
     """
 
-    pass
-    # TODO: how to test that...
+    # Extra specs with tricky xpaths: already in the empty CPACS, duplicated, trailing "/", and
+    # parent of another input
+    cpacs_inout = CPACSInOut()
+    cpacs_inout.add_input(xpath=AIRCRAFT_NAME_XPATH, default_value="Aircraft")
+    cpacs_inout.add_input(xpath=RANGE_XPATH + "/cruiseAltitude", default_value=12000)
+    cpacs_inout.add_input(xpath=RANGE_XPATH + "/cruiseAltitude", default_value=10000)
+    cpacs_inout.add_input(xpath=RANGE_XPATH + "/cruiseSpeed/", default_value=250)
+    cpacs_inout.add_input(xpath="/cpacs/toolspecific/CEASIOMpy/testNode")
+    cpacs_inout.add_input(xpath="/cpacs/toolspecific/CEASIOMpy/testNode/child", default_value=1)
+    cpacs_inout.add_output(xpath=RANGE_XPATH + "/cruiseAltitude")
+    cpacs_inout.add_output(xpath="/cpacs/toolspecific/CEASIOMpy/testOutput")
+
+    all_specs = get_all_module_specs()
+    all_specs["FakeModule"] = SimpleNamespace(cpacs_inout=cpacs_inout)
+    monkeypatch.setattr(moduleinterfaces, "get_all_module_specs", lambda: all_specs)
+
+    # Files are written in a temporary 'doc' directory instead of the one of the repository
+    doc_dir = Path(tmp_path, "doc")
+    doc_dir.mkdir()
+    empty_cpacs_path = Path(doc_dir, "empty_cpacs.xml")
+    shutil.copy(Path(moduleinterfaces.MODULE_DIR, "doc", "empty_cpacs.xml"), empty_cpacs_path)
+    monkeypatch.setattr(moduleinterfaces, "MODULE_DIR", tmp_path)
+
+    create_default_toolspecific()
+
+    ref_input_path = Path(tmp_path, "ref_input_toolspecifics.xml")
+    ref_output_path = Path(tmp_path, "ref_output_toolspecifics.xml")
+    create_default_toolspecific_reference(empty_cpacs_path, ref_input_path, ref_output_path)
+
+    input_toolspecifics = Path(doc_dir, "input_toolspecifics.xml").read_text()
+    output_toolspecifics = Path(doc_dir, "output_toolspecifics.xml").read_text()
+
+    assert input_toolspecifics == ref_input_path.read_text()
+    assert output_toolspecifics == ref_output_path.read_text()
+    assert input_toolspecifics.count("<name>") == 1
 
 
 # =================================================================================================